@@ -2,36 +2,61 @@
 
 import argparse
 import time
+from pathlib import Path
 
 from loguru import logger
 
+from exo_oscilloscope.alarms import AlarmEngine, EventLog, load_rules
 from exo_oscilloscope.config.definitions import DEFAULT_LOG_LEVEL, LogLevel
 from exo_oscilloscope.plotter import ExoPlotter
-from exo_oscilloscope.sim_update import make_simulated_update
+from exo_oscilloscope.sim_update import SimulatedSource, make_simulated_update
+from exo_oscilloscope.telemetry import TelemetrySink
 from exo_oscilloscope.utils import setup_logger
 
 
 def main(
-    log_level: str = DEFAULT_LOG_LEVEL, stderr_level: str = DEFAULT_LOG_LEVEL
+    log_level: str = DEFAULT_LOG_LEVEL,
+    stderr_level: str = DEFAULT_LOG_LEVEL,
+    use_async: bool = False,
+    use_telemetry: bool = False,
+    alarm_rules: Path | None = None,
 ) -> None:
     """Run the main pipeline.
 
     :param log_level: The log level to use.
     :param stderr_level: The std err level to use.
+    :param use_async: Stream simulated data through async sources.
+    :param use_telemetry: Record runtime timings and counters to a JSONL file.
+    :param alarm_rules: Optional JSON file with safety-limit rules to check.
     :return: None
     """
     setup_logger(log_level=log_level, stderr_level=stderr_level)
 
-    gui = ExoPlotter()
+    telemetry = TelemetrySink.create() if use_telemetry else None
+    alarm_engine = None
+    if alarm_rules is not None:
+        alarm_engine = AlarmEngine(load_rules(alarm_rules), event_log=EventLog.create())
+    gui = ExoPlotter(alarm_engine=alarm_engine, telemetry=telemetry)
 
     try:
         start_time = time.time()
-        update_callback = make_simulated_update(gui=gui, start_time=start_time)
-        gui.run(update_callback=update_callback)
+        if use_async:
+            sources = [
+                SimulatedSource(device=i, start_time=start_time)
+                for i in range(len(gui.devices))
+            ]
+            gui.run(sources=sources)
+        else:
+            update_callback = make_simulated_update(gui=gui, start_time=start_time)
+            gui.run(update_callback=update_callback)
     except Exception as err:
         logger.error(f"{err}.")
     finally:
         gui.close()
+        if telemetry is not None:
+            telemetry.close()
+        if alarm_engine is not None:
+            alarm_engine.event_log.close()
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -52,6 +77,29 @@ if __name__ == "__main__":  # pragma: no cover
         required=False,
         type=str,
     )
+    parser.add_argument(
+        "--async-sources",
+        action="store_true",
+        help="Stream simulated data through async sources instead of a timer.",
+    )
+    parser.add_argument(
+        "--telemetry",
+        action="store_true",
+        help="Record runtime timings and counters to a JSONL file.",
+    )
+    parser.add_argument(
+        "--alarm-rules",
+        default=None,
+        help="JSON file with safety-limit rules; alarms are logged to data/events.",
+        required=False,
+        type=Path,
+    )
     args = parser.parse_args()
 
-    main(log_level=args.log_level, stderr_level=args.stderr_level)
+    main(
+        log_level=args.log_level,
+        stderr_level=args.stderr_level,
+        use_async=args.async_sources,
+        use_telemetry=args.telemetry,
+        alarm_rules=args.alarm_rules,
+    )
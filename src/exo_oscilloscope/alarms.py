@@ -0,0 +1,445 @@
+"""Vectorized safety-limit alarms evaluated on incoming sample batches."""
+
+import bisect
+import csv
+import json
+import queue
+import threading
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+from exo_oscilloscope.config.definitions import AXES, ENCODING, EVENTS_DIR, QUAT_AXES
+from exo_oscilloscope.data_classes import AlarmEvent, IMUData, MotorData, SampleBatch
+from exo_oscilloscope.utils import create_timestamped_filepath
+
+IMU_SIGNALS = [
+    *(f"accel_{ax}" for ax in AXES),
+    *(f"gyro_{ax}" for ax in AXES),
+    *(f"mag_{ax}" for ax in AXES),
+    *(f"quat_{ax}" for ax in QUAT_AXES),
+]
+MOTOR_SIGNALS = [f.name for f in fields(MotorData) if f.name != "timestamp"]
+EVENT_COLUMNS = [f.name for f in fields(AlarmEvent)]
+
+_STOP = object()
+
+
+@dataclass
+class ThresholdRule:
+    """Fire when a signal leaves the range [lower, upper].
+
+    :param name: Name of the rule.
+    :param signal: Signal name, e.g. ``"torque"`` or ``"gyro_x"``.
+    :param lower: Lower limit.
+    :param upper: Upper limit.
+    """
+
+    name: str
+    signal: str
+    lower: float = -np.inf
+    upper: float = np.inf
+
+
+@dataclass
+class RateRule:
+    """Fire when the rate of change of a signal exceeds a limit.
+
+    :param name: Name of the rule.
+    :param signal: Signal name, e.g. ``"torque"`` or ``"gyro_x"``.
+    :param max_rate: Maximum absolute rate of change in units per second.
+    """
+
+    name: str
+    signal: str
+    max_rate: float
+
+
+@dataclass
+class DurationRule:
+    """Fire when a signal stays outside [lower, upper] for a minimum duration.
+
+    :param name: Name of the rule.
+    :param signal: Signal name, e.g. ``"torque"`` or ``"gyro_x"``.
+    :param min_duration: Time in seconds the signal must stay out of range.
+    :param lower: Lower limit.
+    :param upper: Upper limit.
+    """
+
+    name: str
+    signal: str
+    min_duration: float
+    lower: float = -np.inf
+    upper: float = np.inf
+
+
+Rule = ThresholdRule | RateRule | DurationRule
+
+# Rule type names used in JSON rule files
+RULE_TYPES: dict[str, type[Rule]] = {
+    "threshold": ThresholdRule,
+    "rate": RateRule,
+    "duration": DurationRule,
+}
+
+
+def load_rules(filepath: Path) -> list[Rule]:
+    """Load alarm rules from a JSON file.
+
+    The file holds a list of objects with a ``type`` key (one of RULE_TYPES)
+    and the fields of the matching rule, e.g.
+    ``{"type": "threshold", "name": "torque_max", "signal": "torque", "upper": 40}``.
+
+    :param filepath: Path of the JSON rule file.
+    :return: List of rules.
+    """
+    rules = []
+    for entry in json.loads(filepath.read_text(encoding=ENCODING)):
+        kind = entry.pop("type")
+        if kind not in RULE_TYPES:
+            raise ValueError(f"Unknown alarm rule type: {kind}.")
+        rules.append(RULE_TYPES[kind](**entry))
+    logger.info(f"Loaded {len(rules)} alarm rule(s) from '{filepath}'.")
+    return rules
+
+
+def imu_matrix(imus: list[IMUData]) -> np.ndarray:
+    """Stack IMU samples into a (signals, samples) array ordered as IMU_SIGNALS."""
+    return np.array(
+        [
+            (
+                *imu.accel.to_tuple(),
+                *imu.gyro.to_tuple(),
+                *imu.mag.to_tuple(),
+                *imu.quat.to_tuple(),
+            )
+            for imu in imus
+        ],
+        dtype=float,
+    ).T
+
+
+def motor_matrix(motors: list[MotorData]) -> np.ndarray:
+    """Stack motor samples into a (signals, samples) array ordered as MOTOR_SIGNALS."""
+    return np.array(
+        [[getattr(motor, name) for name in MOTOR_SIGNALS] for motor in motors],
+        dtype=float,
+    ).T
+
+
+@dataclass
+class _DeviceState:
+    """Per-device state carried between batches."""
+
+    last_time: float | None = None
+    last_values: np.ndarray | None = None
+    hits: np.ndarray | None = None
+    run_start: np.ndarray | None = None
+
+
+@dataclass
+class _RuleSet:
+    """Rules for one data type compiled into arrays."""
+
+    signals: list[str]
+    rules: list[Rule]
+    states: dict[int, _DeviceState] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        index = {name: i for i, name in enumerate(self.signals)}
+        thresholds = [r for r in self.rules if isinstance(r, ThresholdRule)]
+        rates = [r for r in self.rules if isinstance(r, RateRule)]
+        durations = [r for r in self.rules if isinstance(r, DurationRule)]
+        # Rule order matches the rows of the hit matrix
+        self.rules = [*thresholds, *rates, *durations]
+        self.rule_names = [r.name for r in self.rules]
+        self.signal_idx = np.array([index[r.signal] for r in self.rules], dtype=int)
+
+        self.thr_idx = np.array([index[r.signal] for r in thresholds], dtype=int)
+        self.thr_lower = np.array([r.lower for r in thresholds], dtype=float)[:, None]
+        self.thr_upper = np.array([r.upper for r in thresholds], dtype=float)[:, None]
+
+        self.rate_idx = np.array([index[r.signal] for r in rates], dtype=int)
+        self.rate_max = np.array([r.max_rate for r in rates], dtype=float)[:, None]
+
+        self.dur_idx = np.array([index[r.signal] for r in durations], dtype=int)
+        self.dur_lower = np.array([r.lower for r in durations], dtype=float)[:, None]
+        self.dur_upper = np.array([r.upper for r in durations], dtype=float)[:, None]
+        self.dur_min = np.array([r.min_duration for r in durations])[:, None]
+
+    def evaluate(
+        self, device: int, values: np.ndarray, times: np.ndarray
+    ) -> list[AlarmEvent]:
+        """Evaluate all rules on a batch and return the newly raised alarms.
+
+        :param device: Index of the device the batch belongs to.
+        :param values: Array of shape (signals, samples).
+        :param times: Sample timestamps of shape (samples,).
+        :return: Alarm events, one per rule and excursion, ordered by timestamp.
+        """
+        state = self.states.setdefault(device, _DeviceState())
+        hits = np.vstack(
+            [
+                self._thresholds(values),
+                self._rates(state, values, times),
+                self._durations(state, values, times),
+            ]
+        )
+
+        # Only report the first sample of each excursion
+        previous = state.hits
+        if previous is None:
+            previous = np.zeros(len(self.rules), dtype=bool)
+        was_hit = np.hstack([previous[:, None], hits[:, :-1]])
+        rising = hits & ~was_hit
+
+        state.hits = hits[:, -1]
+        state.last_time = float(times[-1])
+        state.last_values = values[:, -1]
+
+        rows, cols = np.nonzero(rising)
+        order = np.argsort(cols, kind="stable")
+        return [
+            AlarmEvent(
+                timestamp=float(times[c]),
+                device=device,
+                rule=self.rule_names[r],
+                signal=self.signals[self.signal_idx[r]],
+                value=float(values[self.signal_idx[r], c]),
+            )
+            for r, c in zip(rows[order], cols[order], strict=True)
+        ]
+
+    def _thresholds(self, values: np.ndarray) -> np.ndarray:
+        selected = values[self.thr_idx]
+        return (selected < self.thr_lower) | (selected > self.thr_upper)
+
+    def _rates(
+        self, state: _DeviceState, values: np.ndarray, times: np.ndarray
+    ) -> np.ndarray:
+        selected = values[self.rate_idx]
+        if state.last_values is None or state.last_time is None:
+            prev_values, prev_time = selected[:, :1], times[:1]
+        else:
+            prev_values = state.last_values[self.rate_idx][:, None]
+            prev_time = np.array([state.last_time])
+        dv = np.diff(np.hstack([prev_values, selected]), axis=1)
+        dt = np.diff(np.concatenate([prev_time, times]))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = np.abs(dv / np.where(dt > 0, dt, np.nan))
+        return np.nan_to_num(rate, nan=0.0) > self.rate_max
+
+    def _durations(
+        self, state: _DeviceState, values: np.ndarray, times: np.ndarray
+    ) -> np.ndarray:
+        selected = values[self.dur_idx]
+        outside = (selected < self.dur_lower) | (selected > self.dur_upper)
+        n_samples = times.shape[0]
+
+        # Index of the last in-range sample; -1 means the current excursion
+        # started in a previous batch
+        positions = np.arange(n_samples)
+        last_inside = np.maximum.accumulate(np.where(outside, -1, positions), axis=1)
+        first_outside = np.minimum(last_inside + 1, n_samples - 1)
+        carried = state.run_start
+        if carried is None:
+            carried = np.full(len(self.dur_idx), np.nan)
+        carried = np.where(np.isnan(carried), times[0], carried)[:, None]
+        start = np.where(last_inside >= 0, times[first_outside], carried)
+
+        state.run_start = np.where(outside[:, -1], start[:, -1], np.nan)
+        return outside & (times - start >= self.dur_min)
+
+
+class EventLog:
+    """Alarm events indexed by timestamp, optionally mirrored to a CSV file.
+
+    Events are added to the in-memory index immediately. Writing to the CSV
+    file happens on a background thread, so adding events never blocks the
+    ingest or GUI thread on disk I/O. Events added after :meth:`close` are
+    only kept in memory.
+    """
+
+    def __init__(self, filepath: Path | None = None) -> None:
+        """Initialize the event log.
+
+        :param filepath: CSV file to append events to, or None to keep them in memory.
+        """
+        self.filepath = filepath
+        self.events: list[AlarmEvent] = []
+        self._timestamps: list[float] = []
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._closed = False
+        if filepath is not None:
+            # Append so that a log sharing the (second resolution) path with
+            # another one never truncates its events
+            with filepath.open("a", encoding=ENCODING, newline="") as file:
+                if file.tell() == 0:
+                    csv.writer(file).writerow(EVENT_COLUMNS)
+            self._writer = threading.Thread(
+                target=self._write_loop, name="event-log", daemon=True
+            )
+            self._writer.start()
+
+    @classmethod
+    def create(cls, output_dir: Path = EVENTS_DIR) -> "EventLog":
+        """Create an event log backed by a timestamped CSV file.
+
+        :param output_dir: Directory to write the CSV file to.
+        :return: EventLog.
+        """
+        filepath = create_timestamped_filepath(
+            suffix="csv", output_dir=output_dir, prefix="events"
+        )
+        logger.info(f"Logging alarm events to '{filepath}'.")
+        return cls(filepath=filepath)
+
+    def __len__(self) -> int:
+        """Return the number of logged events."""
+        return len(self.events)
+
+    def add(self, events: list[AlarmEvent]) -> None:
+        """Add events, keeping the log sorted by timestamp.
+
+        :param events: Events to add.
+        :return: None
+        """
+        if not events:
+            return
+        with self._lock:
+            for event in events:
+                index = bisect.bisect_right(self._timestamps, event.timestamp)
+                self._timestamps.insert(index, event.timestamp)
+                self.events.insert(index, event)
+            # Queued under the lock so no events can follow the stop marker
+            if self._writer is not None and not self._closed:
+                self._queue.put(events)
+
+    def clear(self) -> None:
+        """Drop all events from the in-memory index; the CSV file is kept."""
+        with self._lock:
+            self.events.clear()
+            self._timestamps.clear()
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Write the pending events and stop the writer thread.
+
+        :param timeout: Seconds to wait for the thread to finish.
+        :return: None
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._writer is not None:
+                self._queue.put(_STOP)
+        if self._writer is not None:
+            self._writer.join(timeout)
+
+    def _write_loop(self) -> None:
+        stopped = False
+        while not stopped:
+            pending = [self._queue.get()]
+            while not self._queue.empty():
+                pending.append(self._queue.get())
+            if _STOP in pending:
+                stopped = True
+                pending = pending[: pending.index(_STOP)]
+            rows = [asdict(event) for events in pending for event in events]
+            if rows and self.filepath is not None:
+                with self.filepath.open("a", encoding=ENCODING, newline="") as file:
+                    csv.DictWriter(file, fieldnames=EVENT_COLUMNS).writerows(rows)
+
+    def between(self, start: float, stop: float) -> list[AlarmEvent]:
+        """Return the events with start <= timestamp <= stop.
+
+        :param start: Start timestamp in seconds.
+        :param stop: Stop timestamp in seconds.
+        :return: Events ordered by timestamp.
+        """
+        with self._lock:
+            lo = bisect.bisect_left(self._timestamps, start)
+            hi = bisect.bisect_right(self._timestamps, stop)
+            return self.events[lo:hi]
+
+
+class AlarmEngine:
+    """Evaluate safety rules on IMU and motor batches as they are ingested."""
+
+    def __init__(self, rules: list[Rule], event_log: EventLog | None = None) -> None:
+        """Initialize the alarm engine.
+
+        :param rules: Rules to evaluate; the signal name selects IMU or motor data.
+        :param event_log: Log receiving every alarm, a new in-memory log if None.
+        """
+        unknown = [
+            r.signal for r in rules if r.signal not in (*IMU_SIGNALS, *MOTOR_SIGNALS)
+        ]
+        if unknown:
+            raise ValueError(f"Unknown alarm signal(s): {unknown}.")
+
+        self.event_log = event_log if event_log is not None else EventLog()
+        self._imu_rules = _RuleSet(
+            signals=IMU_SIGNALS, rules=[r for r in rules if r.signal in IMU_SIGNALS]
+        )
+        self._motor_rules = _RuleSet(
+            signals=MOTOR_SIGNALS, rules=[r for r in rules if r.signal in MOTOR_SIGNALS]
+        )
+
+    def evaluate(
+        self, device: int, imus: list[IMUData], motors: list[MotorData]
+    ) -> list[AlarmEvent]:
+        """Evaluate all rules on the IMU and motor samples of one device.
+
+        :param device: Index of the device the samples belong to.
+        :param imus: IMU samples ordered by timestamp.
+        :param motors: Motor samples ordered by timestamp.
+        :return: Newly raised alarm events.
+        """
+        return self.evaluate_imus(device, imus) + self.evaluate_motors(device, motors)
+
+    def evaluate_batch(self, batch: SampleBatch) -> list[AlarmEvent]:
+        """Evaluate all rules on a batch of samples.
+
+        :param batch: SampleBatch from a single device.
+        :return: Newly raised alarm events.
+        """
+        return self.evaluate(batch.device, imus=batch.imus, motors=batch.motors)
+
+    def evaluate_imus(self, device: int, imus: list[IMUData]) -> list[AlarmEvent]:
+        """Evaluate the IMU rules on a batch of IMU samples.
+
+        :param device: Index of the device the samples belong to.
+        :param imus: IMU samples ordered by timestamp.
+        :return: Newly raised alarm events.
+        """
+        if not imus or not self._imu_rules.rules:
+            return []
+        times = np.array([imu.timestamp for imu in imus], dtype=float)
+        return self._record(self._imu_rules.evaluate(device, imu_matrix(imus), times))
+
+    def evaluate_motors(self, device: int, motors: list[MotorData]) -> list[AlarmEvent]:
+        """Evaluate the motor rules on a batch of motor samples.
+
+        :param device: Index of the device the samples belong to.
+        :param motors: Motor samples ordered by timestamp.
+        :return: Newly raised alarm events.
+        """
+        if not motors or not self._motor_rules.rules:
+            return []
+        times = np.array([motor.timestamp for motor in motors], dtype=float)
+        events = self._motor_rules.evaluate(device, motor_matrix(motors), times)
+        return self._record(events)
+
+    def _record(self, events: list[AlarmEvent]) -> list[AlarmEvent]:
+        for event in events:
+            logger.warning(
+                f"Alarm '{event.rule}' on device {event.device}: "
+                f"{event.signal}={event.value:.3f} at t={event.timestamp:.3f} s."
+            )
+        self.event_log.add(events)
+        return events
@@ -0,0 +1,514 @@
+"""Benchmark the hot paths of the oscilloscope and compare against baselines."""
+
+import argparse
+import gc
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from loguru import logger
+from PySide6.QtWidgets import QApplication
+
+from exo_oscilloscope.alarms import (
+    AlarmEngine,
+    DurationRule,
+    RateRule,
+    Rule,
+    ThresholdRule,
+)
+from exo_oscilloscope.config.definitions import (
+    BENCHMARK_BATCH_SIZES,
+    BENCHMARK_BUFFER_SIZES,
+    BENCHMARK_DEVICE_COUNTS,
+    BENCHMARK_POOL_SIZE,
+    BENCHMARK_REPEATS,
+    BENCHMARK_THRESHOLD,
+    DEFAULT_LOG_LEVEL,
+    ENCODING,
+    LogLevel,
+)
+from exo_oscilloscope.data_classes import SampleBatch
+from exo_oscilloscope.panels import IMUPanel, MotorPanel
+from exo_oscilloscope.plotter import ExoPlotter
+from exo_oscilloscope.sim_update import SimulatedSource, simulate_imu, simulate_motor
+from exo_oscilloscope.utils import setup_logger
+
+Operation = Callable[[], None]
+
+# Typical exo safety limits, evaluated by the batched plotter benchmark
+BENCHMARK_ALARM_RULES: list[Rule] = [
+    ThresholdRule("torque_limit", "torque", lower=-0.9, upper=0.9),
+    ThresholdRule("speed_limit", "speed", lower=-0.9, upper=0.9),
+    RateRule("torque_rate", "torque", max_rate=50.0),
+    RateRule("gyro_rate", "gyro_x", max_rate=5000.0),
+    DurationRule("gyro_hold", "gyro_z", min_duration=0.1, lower=-150, upper=150),
+]
+
+
+@dataclass
+class BenchmarkCase:
+    """A single benchmark configuration.
+
+    :param name: Name of the benchmarked operation.
+    :param buffer_size: Samples kept per plotted signal.
+    :param devices: Number of devices updated per call.
+    :param batch_size: Samples per device per call.
+    """
+
+    name: str
+    buffer_size: int
+    devices: int
+    batch_size: int
+
+    @property
+    def key(self) -> str:
+        """Return a unique key used to match results against a baseline."""
+        return (
+            f"{self.name}[buffer={self.buffer_size},"
+            f"devices={self.devices},batch={self.batch_size}]"
+        )
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory measurements of a benchmark case.
+
+    :param case: The benchmarked configuration.
+    :param repeats: Number of timed calls.
+    :param time_per_call_us: Median time per call in microseconds.
+    :param time_per_sample_us: Median time per sample in microseconds.
+    :param peak_memory_kib: Peak traced memory above the start of the calls in KiB.
+    :param retained_blocks: Memory blocks still allocated after the calls.
+    """
+
+    case: BenchmarkCase
+    repeats: int
+    time_per_call_us: float
+    time_per_sample_us: float
+    peak_memory_kib: float
+    retained_blocks: int
+
+
+@dataclass
+class Regression:
+    """A benchmark that is slower than its baseline.
+
+    :param key: Key of the benchmark case.
+    :param baseline_us: Baseline time per call in microseconds.
+    :param current_us: Current time per call in microseconds.
+    """
+
+    key: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def ratio(self) -> float:
+        """Return the slowdown factor relative to the baseline."""
+        return self.current_us / self.baseline_us
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of a benchmark run with the environment they were measured in."""
+
+    results: list[BenchmarkResult]
+    metadata: dict[str, str] = field(
+        default_factory=lambda: {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+    )
+
+    def save(self, filepath: Path) -> None:
+        """Save the report as a JSON baseline.
+
+        :param filepath: Path of the JSON file.
+        :return: None
+        """
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(json.dumps(asdict(self), indent=2), encoding=ENCODING)
+        logger.info(f"Saved {len(self.results)} benchmark results to '{filepath}'.")
+
+    @classmethod
+    def load(cls, filepath: Path) -> "BenchmarkReport":
+        """Load a report from a JSON baseline.
+
+        :param filepath: Path of the JSON file.
+        :return: BenchmarkReport.
+        """
+        data = json.loads(filepath.read_text(encoding=ENCODING))
+        results = [
+            BenchmarkResult(**{**r, "case": BenchmarkCase(**r["case"])})
+            for r in data["results"]
+        ]
+        return cls(results=results, metadata=data["metadata"])
+
+    def unmatched_keys(self, baseline: "BenchmarkReport") -> list[str]:
+        """Return the case keys that appear in only one of the two reports.
+
+        :param baseline: Report to compare against.
+        :return: Sorted keys missing from either report.
+        """
+        current = {r.case.key for r in self.results}
+        reference = {r.case.key for r in baseline.results}
+        return sorted(current ^ reference)
+
+    def compare(
+        self, baseline: "BenchmarkReport", threshold: float = BENCHMARK_THRESHOLD
+    ) -> list[Regression]:
+        """Return the cases that are slower than the baseline beyond a threshold.
+
+        Only cases present in both reports are compared, see unmatched_keys.
+
+        :param baseline: Report to compare against.
+        :param threshold: Allowed relative slowdown, e.g. 0.2 for 20 %.
+        :return: Regressions ordered by slowdown, worst first.
+        """
+        reference = {r.case.key: r for r in baseline.results}
+        regressions = [
+            Regression(
+                key=r.case.key,
+                baseline_us=reference[r.case.key].time_per_call_us,
+                current_us=r.time_per_call_us,
+            )
+            for r in self.results
+            if r.case.key in reference
+            and r.time_per_call_us
+            > reference[r.case.key].time_per_call_us * (1.0 + threshold)
+        ]
+        return sorted(regressions, key=lambda reg: reg.ratio, reverse=True)
+
+
+def measure(case: BenchmarkCase, func: Operation, repeats: int) -> BenchmarkResult:
+    """Time a function and trace its memory use.
+
+    :param case: The configuration being measured.
+    :param func: Function performing one call of the benchmarked operation.
+    :param repeats: Number of timed calls.
+    :return: BenchmarkResult.
+    """
+    func()  # warm up caches and lazy initialization
+
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        durations = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    # Trace memory in a separate pass so tracing does not distort timings
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(repeats):
+            func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "lineno"))
+
+    time_per_call_us = statistics.median(durations) * 1e6
+    return BenchmarkResult(
+        case=case,
+        repeats=repeats,
+        time_per_call_us=time_per_call_us,
+        time_per_sample_us=time_per_call_us / (case.devices * case.batch_size),
+        peak_memory_kib=(peak_memory - baseline_memory) / 1024,
+        retained_blocks=retained,
+    )
+
+
+def _batch_pool(case: BenchmarkCase) -> Iterator[list[SampleBatch]]:
+    """Pre-generate batches so the timed calls exclude the simulator.
+
+    The pool is cycled with its timestamps shifted by the pool span on every
+    pass, so that rate and duration alarm rules always see time moving forward.
+    """
+    sources = [
+        SimulatedSource(device=i, start_time=0.0, batch_size=case.batch_size)
+        for i in range(case.devices)
+    ]
+    pool = [
+        [
+            source.make_batch(t_end=k * case.batch_size / source.rate_hz)
+            for source in sources
+        ]
+        for k in range(BENCHMARK_POOL_SIZE)
+    ]
+    span = BENCHMARK_POOL_SIZE * case.batch_size / sources[0].rate_hz
+    while True:
+        yield from pool
+        for batch in itertools.chain.from_iterable(pool):
+            for sample in itertools.chain(batch.imus, batch.motors):
+                sample.timestamp += span
+
+
+def _simulate_sample(case: BenchmarkCase) -> Operation:
+    clock = itertools.count()
+
+    def run() -> None:
+        t = float(next(clock))
+        for _ in range(case.devices):
+            simulate_imu(t)
+            simulate_motor(t)
+
+    return run
+
+
+def _simulate_batch(case: BenchmarkCase) -> Operation:
+    sources = [
+        SimulatedSource(device=i, start_time=0.0, batch_size=case.batch_size)
+        for i in range(case.devices)
+    ]
+    clock = itertools.count()
+
+    def run() -> None:
+        t_end = next(clock) * case.batch_size / sources[0].rate_hz
+        for source in sources:
+            source.make_batch(t_end)
+
+    return run
+
+
+def _imu_panel_update(case: BenchmarkCase) -> Operation:
+    panels = [IMUPanel(f"{i}", case.buffer_size) for i in range(case.devices)]
+    pool = _batch_pool(case)
+
+    def run() -> None:
+        for panel, batch in zip(panels, next(pool), strict=True):
+            panel.update(batch.imus[0])
+
+    return run
+
+
+def _imu_panel_update_batch(case: BenchmarkCase) -> Operation:
+    panels = [IMUPanel(f"{i}", case.buffer_size) for i in range(case.devices)]
+    pool = _batch_pool(case)
+
+    def run() -> None:
+        for panel, batch in zip(panels, next(pool), strict=True):
+            panel.update_batch(batch.imus)
+
+    return run
+
+
+def _motor_panel_update(case: BenchmarkCase) -> Operation:
+    panels = [MotorPanel(f"{i}", case.buffer_size) for i in range(case.devices)]
+    pool = _batch_pool(case)
+
+    def run() -> None:
+        for panel, batch in zip(panels, next(pool), strict=True):
+            panel.update(batch.motors[0])
+
+    return run
+
+
+def _motor_panel_update_batch(case: BenchmarkCase) -> Operation:
+    panels = [MotorPanel(f"{i}", case.buffer_size) for i in range(case.devices)]
+    pool = _batch_pool(case)
+
+    def run() -> None:
+        for panel, batch in zip(panels, next(pool), strict=True):
+            panel.update_batch(batch.motors)
+
+    return run
+
+
+def _plotter_update_plots(case: BenchmarkCase) -> Operation:
+    gui = ExoPlotter(buffer_size=case.buffer_size)
+    pool = _batch_pool(case)
+
+    def run() -> None:
+        batches = next(pool)
+        gui.update_plots(
+            imus=[batch.imus[0] for batch in batches],
+            motors=[batch.motors[0] for batch in batches],
+        )
+
+    return run
+
+
+def _plotter_update_batch(case: BenchmarkCase) -> Operation:
+    # Includes the alarm check that run_source performs before emitting a batch
+    engine = AlarmEngine(BENCHMARK_ALARM_RULES)
+    gui = ExoPlotter(alarm_engine=engine, buffer_size=case.buffer_size)
+    pool = _batch_pool(case)
+
+    def run() -> None:
+        for batch in next(pool):
+            batch.events = engine.evaluate_batch(batch)
+            gui.update_batch(batch)
+        engine.event_log.clear()  # keep retained memory bounded across calls
+
+    return run
+
+
+# Benchmark name -> factory building the operation and its fixtures
+OPERATIONS: dict[str, Callable[[BenchmarkCase], Operation]] = {
+    "simulate_sample": _simulate_sample,
+    "simulate_batch": _simulate_batch,
+    "imu_panel.update": _imu_panel_update,
+    "imu_panel.update_batch": _imu_panel_update_batch,
+    "motor_panel.update": _motor_panel_update,
+    "motor_panel.update_batch": _motor_panel_update_batch,
+    "plotter.update_plots": _plotter_update_plots,
+    "plotter.update_batch": _plotter_update_batch,
+}
+
+
+def make_cases(
+    buffer_sizes: Sequence[int] = BENCHMARK_BUFFER_SIZES,
+    device_counts: Sequence[int] = BENCHMARK_DEVICE_COUNTS,
+    batch_sizes: Sequence[int] = BENCHMARK_BATCH_SIZES,
+) -> list[BenchmarkCase]:
+    """Build the grid of benchmark cases.
+
+    :param buffer_sizes: Buffer sizes for the plotting benchmarks.
+    :param device_counts: Device counts for the panel and simulator benchmarks.
+    :param batch_sizes: Batch sizes for the batched benchmarks.
+    :return: List of BenchmarkCase.
+    """
+    cases = []
+    for devices in device_counts:
+        cases.append(BenchmarkCase("simulate_sample", 0, devices, 1))
+        cases.extend(
+            BenchmarkCase("simulate_batch", 0, devices, batch) for batch in batch_sizes
+        )
+    for buffer_size in buffer_sizes:
+        for devices in device_counts:
+            for name in ("imu_panel", "motor_panel"):
+                cases.append(BenchmarkCase(f"{name}.update", buffer_size, devices, 1))
+                cases.extend(
+                    BenchmarkCase(f"{name}.update_batch", buffer_size, devices, batch)
+                    for batch in batch_sizes
+                )
+        # The plotter always shows a left and a right device
+        cases.append(BenchmarkCase("plotter.update_plots", buffer_size, 2, 1))
+        cases.extend(
+            BenchmarkCase("plotter.update_batch", buffer_size, 2, batch)
+            for batch in batch_sizes
+        )
+    return cases
+
+
+def run_benchmarks(
+    cases: Sequence[BenchmarkCase], repeats: int = BENCHMARK_REPEATS
+) -> BenchmarkReport:
+    """Run benchmark cases offscreen.
+
+    :param cases: Cases to run.
+    :param repeats: Number of timed calls per case.
+    :return: BenchmarkReport.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _app = QApplication.instance() or QApplication([])  # panels need a live app
+
+    results = []
+    for case in cases:
+        # The benchmark data trips alarms on purpose; do not time their logging
+        logger.disable("exo_oscilloscope.alarms")
+        try:
+            result = measure(case, OPERATIONS[case.name](case), repeats=repeats)
+        finally:
+            logger.enable("exo_oscilloscope.alarms")
+        logger.info(
+            f"{case.key}: {result.time_per_call_us:.1f} us/call, "
+            f"{result.time_per_sample_us:.2f} us/sample, "
+            f"peak {result.peak_memory_kib:.1f} KiB, "
+            f"{result.retained_blocks} retained blocks"
+        )
+        results.append(result)
+    return BenchmarkReport(results=results)
+
+
+def main(
+    output: Path | None = None,
+    baseline: Path | None = None,
+    threshold: float = BENCHMARK_THRESHOLD,
+    repeats: int = BENCHMARK_REPEATS,
+) -> int:
+    """Run the benchmark suite.
+
+    :param output: Optional path to save the results as a JSON baseline.
+    :param baseline: Optional JSON baseline to compare the results against.
+    :param threshold: Allowed relative slowdown before a case is flagged.
+    :param repeats: Number of timed calls per case.
+    :return: Exit code, 1 if any case regressed or does not match the baseline.
+    """
+    report = run_benchmarks(make_cases(), repeats=repeats)
+    if output is not None:
+        report.save(output)
+    if baseline is None:
+        return 0
+
+    reference = BenchmarkReport.load(baseline)
+    unmatched = report.unmatched_keys(reference)
+    for key in unmatched:
+        logger.error(f"{key} is missing from the current run or from '{baseline}'.")
+    regressions = report.compare(reference, threshold=threshold)
+    for reg in regressions:
+        logger.error(
+            f"{reg.key} regressed: {reg.baseline_us:.1f} -> {reg.current_us:.1f} us "
+            f"({reg.ratio:.2f}x)."
+        )
+    if regressions or unmatched:
+        return 1
+    logger.success(f"No regressions beyond {threshold:.0%} of '{baseline}'.")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser("Benchmark the oscilloscope hot paths.")
+    parser.add_argument("--output", type=Path, help="Save results to a JSON file.")
+    parser.add_argument(
+        "--compare", type=Path, help="Compare results against a JSON baseline."
+    )
+    parser.add_argument(
+        "--threshold",
+        default=BENCHMARK_THRESHOLD,
+        type=float,
+        help="Allowed relative slowdown, e.g. 0.2 for 20 %%.",
+    )
+    parser.add_argument(
+        "--repeats",
+        default=BENCHMARK_REPEATS,
+        type=int,
+        help="Number of timed calls per case.",
+    )
+    parser.add_argument(
+        "--log-level",
+        default=DEFAULT_LOG_LEVEL,
+        choices=list(LogLevel()),
+        help="Set the log level.",
+        type=str,
+    )
+    args = parser.parse_args()
+
+    setup_logger(log_level=args.log_level, stderr_level=args.log_level)
+    sys.exit(
+        main(
+            output=args.output,
+            baseline=args.compare,
+            threshold=args.threshold,
+            repeats=args.repeats,
+        )
+    )
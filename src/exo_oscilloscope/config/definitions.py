@@ -14,6 +14,8 @@ ROOT_DIR: Path = Path("src").parent
 DATA_DIR: Path = ROOT_DIR / "data"
 RECORDINGS_DIR: Path = DATA_DIR / "recordings"
 LOG_DIR: Path = DATA_DIR / "logs"
+TELEMETRY_DIR: Path = DATA_DIR / "telemetry"
+EVENTS_DIR: Path = DATA_DIR / "events"
 
 # Default encoding
 ENCODING: str = "utf-8"
@@ -42,6 +44,8 @@ class LogLevel:
 
 DEFAULT_LOG_LEVEL = LogLevel.info
 DEFAULT_LOG_FILENAME = "log_file"
+HOT_PATH_LOG_INTERVAL = 1.0  # seconds between rate-limited hot-path messages
+TELEMETRY_FLUSH_INTERVAL = 1.0  # seconds between telemetry writes
 
 PENS = [
     pg.mkPen("#000000", width=2),  # blue
@@ -57,8 +61,25 @@ PENS = [
 IMU_COLORS = PENS[0:4]
 MOTOR_COLORS = PENS[4:7]
 
+ALARM_PEN = pg.mkPen("#D00000", width=2)
+ALARM_BRUSH = pg.mkBrush("#D00000")
+
 APP_NAME = "Exo-Oscilloscope"
 BUFFER_SIZE = 200
 
+# Async sources
+SOURCE_TIMEOUT = 1.0  # seconds without a batch before reconnecting
+SOURCE_RECONNECT_DELAY = 0.5  # seconds
+SIM_RATE_HZ = 200.0
+SIM_BATCH_SIZE = 10
+
+# Benchmarks
+BENCHMARK_BUFFER_SIZES = (200, 2000)
+BENCHMARK_DEVICE_COUNTS = (1, 4)
+BENCHMARK_BATCH_SIZES = (10, 100)
+BENCHMARK_REPEATS = 100
+BENCHMARK_POOL_SIZE = 32  # pre-generated batches cycled through by the benchmarks
+BENCHMARK_THRESHOLD = 0.2  # flag cases more than 20 % slower than baseline
+
 AXES = ["x", "y", "z"]
 QUAT_AXES = ["x", "y", "z", "w"]
@@ -1,6 +1,6 @@
 """Custom data classes for my module."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -100,6 +100,42 @@ class MotorData(BaseData):
     position: float
 
 
+@dataclass
+class AlarmEvent(BaseData):
+    """Represent a safety-limit violation.
+
+    :param device: Index of the device that raised the alarm.
+    :param rule: Name of the rule that fired.
+    :param signal: Name of the signal that violated the rule.
+    :param value: Signal value at the time of the violation.
+    """
+
+    device: int
+    rule: str
+    signal: str
+    value: float
+
+
+@dataclass
+class SampleBatch:
+    """Represent a batch of samples produced by a single device.
+
+    :param device: Index of the device the samples belong to (0 = left, 1 = right).
+    :param imus: IMU samples ordered by timestamp.
+    :param motors: Motor samples ordered by timestamp.
+    :param events: Alarm events raised by the samples when they were ingested.
+    """
+
+    device: int
+    imus: list[IMUData] = field(default_factory=list)
+    motors: list[MotorData] = field(default_factory=list)
+    events: list[AlarmEvent] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Return the number of samples in the batch."""
+        return max(len(self.imus), len(self.motors))
+
+
 @dataclass
 class PlotConfig:
     """Configuration for a single pyqtgraph plot."""
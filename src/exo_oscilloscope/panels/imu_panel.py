@@ -5,20 +5,21 @@ from loguru import logger
 from PySide6 import QtWidgets
 
 from exo_oscilloscope.config.definitions import AXES, BUFFER_SIZE, IMU_COLORS, QUAT_AXES
-from exo_oscilloscope.data_classes import IMUData
-from exo_oscilloscope.panels.plot_utils import make_plot
+from exo_oscilloscope.data_classes import AlarmEvent, IMUData
+from exo_oscilloscope.panels.plot_utils import EventMarkers, make_plot, shift_in
 
 
 class IMUPanel:
     """UI container + buffers + curves for a single IMU."""
 
-    def __init__(self, title_prefix: str) -> None:
+    def __init__(self, title_prefix: str, buffer_size: int = BUFFER_SIZE) -> None:
         """Initialize the panel.
 
         :param title_prefix: prefix for title
+        :param buffer_size: number of samples kept per signal
         """
         logger.debug("Initializing IMU panel.")
-        self.buffer_size = BUFFER_SIZE
+        self.buffer_size = buffer_size
         self.pens = IMU_COLORS
 
         # Buffers
@@ -42,6 +43,14 @@ class IMUPanel:
         self.layout.addWidget(self.mag_plot)
         self.layout.addWidget(self.quat_plot)
 
+        # Alarm markers, keyed by signal group
+        self.markers = {
+            "accel": EventMarkers(self.accel_plot),
+            "gyro": EventMarkers(self.gyro_plot),
+            "mag": EventMarkers(self.mag_plot),
+            "quat": EventMarkers(self.quat_plot),
+        }
+
         # Curves
         self.accel_curves = [
             self.accel_plot.plot(pen=self.pens[i], name=f"accel_{ax}")
@@ -82,7 +91,38 @@ class IMUPanel:
         self.mag_buf[:, -1] = imu.mag.to_tuple()
         self.quat_buf[:, -1] = imu.quat.to_tuple()
 
-        # --- update curves ---
+        self._refresh_curves()
+
+    def update_batch(self, imus: list[IMUData]) -> None:
+        """Update this panel with a batch of IMUData in a single shift.
+
+        :param imus: IMUData samples ordered by timestamp.
+        :return: None
+        """
+        if not imus:
+            return
+
+        shift_in(self.time_buf, np.array([imu.timestamp for imu in imus]))
+        shift_in(self.accel_buf, np.array([imu.accel.to_tuple() for imu in imus]).T)
+        shift_in(self.gyro_buf, np.array([imu.gyro.to_tuple() for imu in imus]).T)
+        shift_in(self.mag_buf, np.array([imu.mag.to_tuple() for imu in imus]).T)
+        shift_in(self.quat_buf, np.array([imu.quat.to_tuple() for imu in imus]).T)
+
+        self._refresh_curves()
+
+    def add_event(self, event: AlarmEvent) -> None:
+        """Mark an alarm event on the plot of its signal.
+
+        :param event: AlarmEvent raised on this IMU.
+        :return: None
+        """
+        group = event.signal.split("_")[0]
+        self.markers[group].add(event.timestamp, event.value)
+
+    def _refresh_curves(self) -> None:
+        for markers in self.markers.values():
+            markers.prune(self.time_buf[0])
+
         for i in range(3):
             self.accel_curves[i].setData(self.time_buf, self.accel_buf[i])
             self.gyro_curves[i].setData(self.time_buf, self.gyro_buf[i])
@@ -7,16 +7,16 @@ from loguru import logger
 from PySide6 import QtWidgets
 
 from exo_oscilloscope.config.definitions import BUFFER_SIZE, MOTOR_COLORS
-from exo_oscilloscope.data_classes import MotorData
-from exo_oscilloscope.panels.plot_utils import make_plot
+from exo_oscilloscope.data_classes import AlarmEvent, MotorData
+from exo_oscilloscope.panels.plot_utils import EventMarkers, make_plot, shift_in
 
 
 class MotorPanel:
     """UI panel with dynamic buffers + curves for motor signals."""
 
-    def __init__(self, title_prefix: str) -> None:
+    def __init__(self, title_prefix: str, buffer_size: int = BUFFER_SIZE) -> None:
         logger.debug("Initializing Motor panel.")
-        self.buffer_size = BUFFER_SIZE
+        self.buffer_size = buffer_size
         self.pens = MOTOR_COLORS
 
         # -----------------------------------------------------------
@@ -39,6 +39,7 @@ class MotorPanel:
         # Single combined plot for all motor data
         self.plot_widget = make_plot(f"{title_prefix} Motor Signals", "Value")
         self.layout.addWidget(self.plot_widget)
+        self.markers = EventMarkers(self.plot_widget)
 
         # -----------------------------------------------------------
         # Create curves dynamically
@@ -64,6 +65,25 @@ class MotorPanel:
             buf[:-1] = buf[1:]
             buf[-1] = getattr(motor, name)
 
-        # ---- Update curves ----
+        self._refresh_curves()
+
+    def update_batch(self, motors: list[MotorData]) -> None:
+        """Update this panel with a batch of MotorData in a single shift."""
+        if not motors:
+            return
+
+        shift_in(self.time_buf, np.array([motor.timestamp for motor in motors]))
+        for name in self.signal_names:
+            values = np.array([getattr(motor, name) for motor in motors])
+            shift_in(self.buffers[name], values)
+
+        self._refresh_curves()
+
+    def add_event(self, event: AlarmEvent) -> None:
+        """Mark an alarm event on the motor plot."""
+        self.markers.add(event.timestamp, event.value)
+
+    def _refresh_curves(self) -> None:
+        self.markers.prune(self.time_buf[0])
         for name in self.signal_names:
             self.curves[name].setData(self.time_buf, self.buffers[name])
@@ -1,7 +1,10 @@
 """Sample doc string."""
 
+import numpy as np
 import pyqtgraph as pg
 
+from exo_oscilloscope.config.definitions import ALARM_BRUSH, ALARM_PEN
+
 
 def make_plot(title: str, y_label: str) -> pg.PlotWidget:
     """Make a plot with given title and Y-axis label."""
@@ -14,3 +17,44 @@ def make_plot(title: str, y_label: str) -> pg.PlotWidget:
     plot.setLabel("bottom", "Time (s)")
 
     return plot
+
+
+def shift_in(buf: np.ndarray, values: np.ndarray) -> None:
+    """Shift new samples into the end of a rolling buffer in place.
+
+    :param buf: Buffer with samples along the last axis.
+    :param values: New samples along the last axis, oldest first.
+    :return: None
+    """
+    n = min(values.shape[-1], buf.shape[-1])
+    if n == 0:
+        return
+    buf[..., :-n] = buf[..., n:]
+    buf[..., -n:] = values[..., -n:]
+
+
+class EventMarkers:
+    """Scatter markers for alarm events that scroll out with the plot buffer."""
+
+    def __init__(self, plot: pg.PlotWidget) -> None:
+        self.item = pg.ScatterPlotItem(
+            symbol="x", size=12, pen=ALARM_PEN, brush=ALARM_BRUSH
+        )
+        plot.addItem(self.item)
+        self.times = np.empty(0)
+        self.values = np.empty(0)
+
+    def add(self, time: float, value: float) -> None:
+        """Add a marker at the given time and value."""
+        self.times = np.append(self.times, time)
+        self.values = np.append(self.values, value)
+        self.item.setData(self.times, self.values)
+
+    def prune(self, start_time: float) -> None:
+        """Drop markers older than the oldest buffered sample."""
+        if self.times.size == 0 or self.times[0] >= start_time:
+            return
+        keep = self.times >= start_time
+        self.times = self.times[keep]
+        self.values = self.values[keep]
+        self.item.setData(self.times, self.values)
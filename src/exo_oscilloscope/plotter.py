@@ -1,6 +1,7 @@
 """Sample doc string."""
 
-from typing import Callable
+import time
+from collections.abc import Callable, Sequence
 
 import pyqtgraph as pg
 from loguru import logger
@@ -8,23 +9,44 @@ from PySide6.QtCore import QTimer
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QApplication, QHBoxLayout, QVBoxLayout, QWidget
 
-from exo_oscilloscope.config.definitions import APP_NAME
-from exo_oscilloscope.data_classes import IMUData, MotorData
+from exo_oscilloscope.alarms import MOTOR_SIGNALS, AlarmEngine
+from exo_oscilloscope.config.definitions import APP_NAME, BUFFER_SIZE
+from exo_oscilloscope.data_classes import AlarmEvent, IMUData, MotorData, SampleBatch
 from exo_oscilloscope.panels import IMUPanel, MotorPanel
+from exo_oscilloscope.sources import AsyncSource, SourceRunner
+from exo_oscilloscope.telemetry import TelemetrySink
+from exo_oscilloscope.utils import RateLimitedLogger
+
+_frame_log = RateLimitedLogger()
 
 
 class ExoPlotter:
     """Main application class for the exoskeleton plotting UI."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        alarm_engine: AlarmEngine | None = None,
+        buffer_size: int = BUFFER_SIZE,
+        telemetry: TelemetrySink | None = None,
+    ) -> None:
+        """Initialize the plotter.
+
+        :param alarm_engine: Optional engine checking safety limits as sources ingest data.
+        :param buffer_size: Number of samples kept per plotted signal.
+        :param telemetry: Optional sink recording update timings and sample counts.
+        """
         logger.info("Starting the exosuit oscilloscope pipeline.")
 
         self.pg = pg
         self.name = APP_NAME
         self._timer: QTimer | None = None
+        self._runner: SourceRunner | None = None
+        self.alarm_engine = alarm_engine
+        self.telemetry = telemetry
 
-        # Qt application + main window
-        self.app = QApplication([])
+        # Qt application + main window (Qt allows only one per process)
+        app = QApplication.instance()
+        self.app = app if isinstance(app, QApplication) else QApplication([])
         self.app.setFont(QFont("Helvetica"))
 
         self.window = QWidget()
@@ -35,10 +57,14 @@ class ExoPlotter:
         self.window.setLayout(self.main_layout)
 
         # Create IMU and motor panels
-        self.left_imu = IMUPanel("Left")
-        self.right_imu = IMUPanel("Right")
-        self.left_motor = MotorPanel("Left")
-        self.right_motor = MotorPanel("Right")
+        self.left_imu = IMUPanel("Left", buffer_size=buffer_size)
+        self.right_imu = IMUPanel("Right", buffer_size=buffer_size)
+        self.left_motor = MotorPanel("Left", buffer_size=buffer_size)
+        self.right_motor = MotorPanel("Right", buffer_size=buffer_size)
+        self.devices = [
+            (self.left_imu, self.left_motor),
+            (self.right_imu, self.right_motor),
+        ]
 
         # Create stacked columns for left and right side
         self.left_column = QVBoxLayout()
@@ -59,10 +85,31 @@ class ExoPlotter:
         self.main_layout.addLayout(self.left_column)
         self.main_layout.addLayout(self.right_column)
 
-    def update_plots(self, imus: list[IMUData], motors: list[MotorData]) -> None:
-        """Update the plots."""
+    def update_plots(
+        self,
+        imus: list[IMUData],
+        motors: list[MotorData],
+        events: list[AlarmEvent] | None = None,
+    ) -> None:
+        """Update the plots.
+
+        :param imus: Left and right IMU samples.
+        :param motors: Left and right motor samples.
+        :param events: Alarm events raised by the samples when they were ingested.
+        :return: None
+        """
+        start = time.perf_counter()
         self.update_left(imus[0], motors[0])
         self.update_right(imus[1], motors[1])
+        if events:
+            self._mark_events(events)
+
+        if self.telemetry is not None:
+            elapsed = time.perf_counter() - start
+            self.telemetry.record_timing("plotter.update_plots", elapsed)
+            self.telemetry.increment("plotter.samples", len(imus))
+            if events:
+                self.telemetry.increment("alarms", len(events))
 
     def update_left(self, imu: IMUData, motor: MotorData) -> None:
         """Plot left IMU and motor data."""
@@ -74,12 +121,45 @@ class ExoPlotter:
         self.right_imu.update(imu)
         self.right_motor.update(motor)
 
+    def update_batch(self, batch: SampleBatch) -> None:
+        """Plot a batch of samples from a single device."""
+        _frame_log.log("Plotting {} samples from device {}.", len(batch), batch.device)
+        start = time.perf_counter()
+        imu_panel, motor_panel = self.devices[batch.device]
+        imu_panel.update_batch(batch.imus)
+        motor_panel.update_batch(batch.motors)
+        self._mark_events(batch.events)
+
+        if self.telemetry is not None:
+            elapsed = time.perf_counter() - start
+            self.telemetry.record_timing("plotter.update_batch", elapsed)
+            self.telemetry.increment(
+                f"plotter.samples.device{batch.device}", len(batch)
+            )
+            if batch.events:
+                self.telemetry.increment("alarms", len(batch.events))
+
+    def _mark_events(self, events: list[AlarmEvent]) -> None:
+        for event in events:
+            imu_panel, motor_panel = self.devices[event.device]
+            if event.signal in MOTOR_SIGNALS:
+                motor_panel.add_event(event)
+            else:
+                imu_panel.add_event(event)
+
     def run(
         self,
         update_callback: Callable[[], None] | None = None,
         delay_millisecond: int = 5,
+        sources: Sequence[AsyncSource] | None = None,
     ) -> None:
-        """Run the GUI event loop."""
+        """Run the GUI event loop.
+
+        :param update_callback: Optional callback polled by a timer.
+        :param delay_millisecond: Timer interval for the update callback.
+        :param sources: Optional async sources streaming batches to the plots.
+        :return: None
+        """
         logger.debug("Running the exosuit oscilloscope pipeline.")
         self.window.show()
         self._initialize_panels()
@@ -90,11 +170,19 @@ class ExoPlotter:
             timer.start(delay_millisecond)
             self._timer = timer  # Keep timer alive
 
+        if sources:
+            self._runner = SourceRunner(
+                sources, on_batch=self.update_batch, alarm_engine=self.alarm_engine
+            )
+            self._runner.start()
+
         self.app.exec()
 
     def close(self) -> None:
         """Close the application."""
         logger.info(f"Closing {self.name}...")
+        if self._runner is not None:
+            self._runner.stop()
         self.window.close()
         self.app.quit()
         logger.success(f"{self.name} is now closed.")
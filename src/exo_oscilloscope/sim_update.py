@@ -1,15 +1,56 @@
 """Simulator functions for the exosuit oscilloscope."""
 
+import asyncio
 import time
+from collections.abc import AsyncGenerator
 
 import numpy as np
-from loguru import logger
 
-from exo_oscilloscope.data_classes import IMUData, MotorData, Quaternion, Vector3
+from exo_oscilloscope.config.definitions import SIM_BATCH_SIZE, SIM_RATE_HZ
+from exo_oscilloscope.data_classes import (
+    IMUData,
+    MotorData,
+    Quaternion,
+    SampleBatch,
+    Vector3,
+)
 from exo_oscilloscope.plotter import ExoPlotter
+from exo_oscilloscope.sources import AsyncSource
+from exo_oscilloscope.utils import RateLimitedLogger
 
 GRAVITY = 9.81
 
+_update_log = RateLimitedLogger()
+
+
+def simulate_imu(t: float) -> IMUData:
+    """Generate a fake IMU measurement.
+
+    :param t: Time in seconds since the start of the simulation.
+    :return: Simulated IMUData.
+    """
+    return IMUData(
+        accel=GRAVITY * Vector3(np.sin(t), np.sin(t * 2), np.sin(t * 4)),
+        gyro=180 * Vector3(np.cos(t), np.cos(t * 2), np.cos(t * 4)),
+        mag=Vector3(np.cos(t), np.cos(t * 2), np.cos(t * 4)),
+        quat=Quaternion(np.sin(t + 1), np.sin(t + 2), np.sin(t + 3), np.sin(t + 4)),
+        timestamp=t,
+    )
+
+
+def simulate_motor(t: float) -> MotorData:
+    """Generate a fake motor measurement.
+
+    :param t: Time in seconds since the start of the simulation.
+    :return: Simulated MotorData.
+    """
+    return MotorData(
+        position=np.sin(t),
+        speed=np.sin(t + 0.25),
+        torque=np.sin(t + 0.5),
+        timestamp=t,
+    )
+
 
 def make_simulated_update(gui: ExoPlotter, start_time: float):  # pragma: no cover
     """Return an update callback that generates fake IMU data.
@@ -20,21 +61,57 @@ def make_simulated_update(gui: ExoPlotter, start_time: float):  # pragma: no cov
     """
 
     def update() -> None:
-        logger.trace("Simulating IMU update...")
+        _update_log.log("Simulating IMU update...")
         t = time.time() - start_time
-        imu = IMUData(
-            accel=GRAVITY * Vector3(np.sin(t), np.sin(t * 2), np.sin(t * 4)),
-            gyro=180 * Vector3(np.cos(t), np.cos(t * 2), np.cos(t * 4)),
-            mag=Vector3(np.cos(t), np.cos(t * 2), np.cos(t * 4)),
-            quat=Quaternion(np.sin(t + 1), np.sin(t + 2), np.sin(t + 3), np.sin(t + 4)),
-            timestamp=t,
-        )
-        motor = MotorData(
-            position=np.sin(t),
-            speed=np.sin(t + 0.25),
-            torque=np.sin(t + 0.5),
-            timestamp=t,
-        )
-        gui.update_plots(imus=[imu, imu], motors=[motor, motor])
+        imu = simulate_imu(t)
+        motor = simulate_motor(t)
+        events = []
+        if gui.alarm_engine is not None:
+            for device in range(len(gui.devices)):
+                events += gui.alarm_engine.evaluate(device, [imu], [motor])
+        gui.update_plots(imus=[imu, imu], motors=[motor, motor], events=events)
 
     return update
+
+
+class SimulatedSource(AsyncSource):
+    """Async source that generates fake IMU and motor batches at a fixed rate."""
+
+    def __init__(
+        self,
+        device: int,
+        start_time: float,
+        rate_hz: float = SIM_RATE_HZ,
+        batch_size: int = SIM_BATCH_SIZE,
+    ) -> None:
+        """Initialize the simulated source.
+
+        :param device: Index of the device the batches are plotted on.
+        :param start_time: The start time for time offset calculation.
+        :param rate_hz: Simulated sample rate in Hz.
+        :param batch_size: Number of samples per batch.
+        """
+        super().__init__(name=f"simulated-{device}", device=device)
+        self.start_time = start_time
+        self.rate_hz = rate_hz
+        self.batch_size = batch_size
+
+    def make_batch(self, t_end: float) -> SampleBatch:
+        """Generate the batch of samples ending at the given time.
+
+        :param t_end: Timestamp of the last sample in seconds.
+        :return: SampleBatch.
+        """
+        times = t_end - np.arange(self.batch_size)[::-1] / self.rate_hz
+        return SampleBatch(
+            device=self.device,
+            imus=[simulate_imu(t) for t in times],
+            motors=[simulate_motor(t) for t in times],
+        )
+
+    async def stream(self) -> AsyncGenerator[SampleBatch, None]:
+        """Yield simulated batches in real time."""
+        period = self.batch_size / self.rate_hz
+        while True:
+            await asyncio.sleep(period)
+            yield self.make_batch(time.time() - self.start_time)
@@ -0,0 +1,6 @@
+"""Asynchronous data sources for the oscilloscope."""
+
+from .base import AsyncSource
+from .runner import SourceRunner, run_source
+
+__all__ = ["AsyncSource", "SourceRunner", "run_source"]
@@ -0,0 +1,50 @@
+"""Base class for asynchronous data sources."""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator
+
+from exo_oscilloscope.config.definitions import (
+    SOURCE_RECONNECT_DELAY,
+    SOURCE_TIMEOUT,
+)
+from exo_oscilloscope.data_classes import SampleBatch
+
+
+class AsyncSource(ABC):
+    """A device that produces sample batches as an async iterator.
+
+    Subclasses implement :meth:`stream` as an async generator. The stream is
+    restarted by the runner after a timeout or an I/O error, so any connection
+    setup (opening a serial port, connecting a socket, opening a replay file)
+    belongs inside :meth:`stream`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        device: int,
+        timeout: float | None = SOURCE_TIMEOUT,
+        reconnect_delay: float = SOURCE_RECONNECT_DELAY,
+        max_retries: int | None = None,
+    ) -> None:
+        """Initialize the source.
+
+        :param name: Human-readable name used in log messages.
+        :param device: Index of the device the batches are plotted on.
+        :param timeout: Seconds to wait for a batch before reconnecting, or None.
+        :param reconnect_delay: Seconds to wait before restarting the stream.
+        :param max_retries: Reconnect attempts before giving up, or None for no limit.
+        """
+        self.name = name
+        self.device = device
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_retries = max_retries
+
+    @abstractmethod
+    def stream(self) -> AsyncGenerator[SampleBatch, None]:
+        """Yield sample batches until the source is exhausted."""
+
+    def __aiter__(self) -> AsyncGenerator[SampleBatch, None]:
+        """Iterate over the sample batches of a fresh stream."""
+        return self.stream()
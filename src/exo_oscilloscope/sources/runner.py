@@ -0,0 +1,146 @@
+"""Run asynchronous sources on an asyncio loop bridged to the Qt event loop."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Sequence
+
+from loguru import logger
+from PySide6.QtCore import QObject, Qt, Signal, Slot
+
+from exo_oscilloscope.alarms import AlarmEngine
+from exo_oscilloscope.data_classes import SampleBatch
+from exo_oscilloscope.sources.base import AsyncSource
+
+BatchHandler = Callable[[SampleBatch], None]
+
+
+async def run_source(
+    source: AsyncSource,
+    emit: BatchHandler,
+    alarm_engine: AlarmEngine | None = None,
+) -> None:
+    """Consume a source, restarting its stream after timeouts and errors.
+
+    :param source: The source to consume.
+    :param emit: Called with every batch the source yields.
+    :param alarm_engine: Optional engine attaching alarm events to each batch.
+    :return: None
+    """
+    retries = 0
+    while True:
+        stream = source.stream()
+        try:
+            while True:
+                async with asyncio.timeout(source.timeout):
+                    batch = await anext(stream)
+                if alarm_engine is not None:
+                    batch.events = alarm_engine.evaluate_batch(batch)
+                emit(batch)
+                retries = 0
+        except StopAsyncIteration:
+            logger.info(f"Source '{source.name}' finished.")
+            return
+        except Exception as err:
+            # CancelledError is not an Exception, so shutdown still propagates
+            retries += 1
+            if source.max_retries is not None and retries > source.max_retries:
+                logger.exception(f"Source '{source.name}' gave up after {err!r}.")
+                return
+            logger.exception(
+                f"Source '{source.name}' failed with {err!r}, "
+                f"reconnecting in {source.reconnect_delay} s."
+            )
+        finally:
+            await stream.aclose()
+        await asyncio.sleep(source.reconnect_delay)
+
+
+class _BatchBridge(QObject):
+    """Deliver batches from the asyncio thread to the Qt thread."""
+
+    batch_ready = Signal(object)
+
+    def __init__(self, handler: BatchHandler) -> None:
+        super().__init__()
+        self._handler = handler
+        self.batch_ready.connect(self._deliver, Qt.ConnectionType.QueuedConnection)
+
+    @Slot(object)
+    def _deliver(self, batch: SampleBatch) -> None:
+        self._handler(batch)
+
+
+class SourceRunner:
+    """Run many sources concurrently on a single asyncio loop.
+
+    The loop lives in one background thread, regardless of the number of
+    sources. Batches are handed to the Qt event loop through a queued signal,
+    so ``on_batch`` always runs on the GUI thread. Alarm rules are evaluated
+    on the asyncio thread before a batch is handed over.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[AsyncSource],
+        on_batch: BatchHandler,
+        alarm_engine: AlarmEngine | None = None,
+    ) -> None:
+        """Initialize the runner.
+
+        :param sources: Sources to run concurrently.
+        :param on_batch: Called on the Qt thread with every batch.
+        :param alarm_engine: Optional engine checking every batch as it is ingested.
+        """
+        self.sources = list(sources)
+        self.alarm_engine = alarm_engine
+        self._bridge = _BatchBridge(on_batch)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._ready = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return True while the asyncio loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the asyncio loop thread and all sources."""
+        if self.running:
+            return
+        logger.debug(f"Starting {len(self.sources)} async source(s).")
+        self._ready.clear()
+        self._thread = threading.Thread(
+            target=asyncio.run, args=(self._main(),), name="source-runner", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Cancel all sources and join the asyncio loop thread.
+
+        :param timeout: Seconds to wait for the thread to finish.
+        :return: None
+        """
+        if not self.running or self._loop is None or self._stop_event is None:
+            return
+        logger.debug("Stopping async sources.")
+        self._loop.call_soon_threadsafe(self._stop_event.set)
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    async def _main(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._ready.set()
+
+        tasks = [
+            asyncio.create_task(
+                run_source(source, self._bridge.batch_ready.emit, self.alarm_engine)
+            )
+            for source in self.sources
+        ]
+        await self._stop_event.wait()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,180 @@
+"""Structured runtime telemetry written to JSONL from a background thread."""
+
+import json
+import queue
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+
+from loguru import logger
+
+from exo_oscilloscope.config.definitions import (
+    ENCODING,
+    TELEMETRY_DIR,
+    TELEMETRY_FLUSH_INTERVAL,
+)
+from exo_oscilloscope.utils import create_timestamped_filepath
+
+TIMING = "timing"
+COUNTER = "counter"
+
+_STOP = object()
+
+
+class TelemetrySink:
+    """Record timing and counter samples to a JSONL file.
+
+    Recording only puts a tuple on a queue. A background thread drains the
+    queue, sums the counters and appends one JSON object per line::
+
+        {"time": 12.5, "kind": "timing", "name": "plotter.update_plots", "value": 0.003}
+        {"time": 13.0, "kind": "counter", "name": "samples.device0", "value": 2000}
+
+    Timings are written for every sample in seconds. Counters are written once
+    per flush interval as running totals. ``time`` is seconds since the sink
+    was started.
+    """
+
+    def __init__(
+        self, filepath: Path, flush_interval: float = TELEMETRY_FLUSH_INTERVAL
+    ) -> None:
+        """Initialize the sink.
+
+        :param filepath: JSONL file to append samples to.
+        :param flush_interval: Seconds between two writes to the file.
+        """
+        self.filepath = filepath
+        self.flush_interval = flush_interval
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._counters: dict[str, float] = defaultdict(float)
+        self._start_time = time.perf_counter()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def create(cls, output_dir: Path = TELEMETRY_DIR) -> "TelemetrySink":
+        """Create a started sink backed by a timestamped JSONL file.
+
+        :param output_dir: Directory to write the JSONL file to.
+        :return: TelemetrySink.
+        """
+        filepath = create_timestamped_filepath(
+            suffix="jsonl", output_dir=output_dir, prefix="telemetry"
+        )
+        logger.info(f"Recording telemetry to '{filepath}'.")
+        sink = cls(filepath=filepath)
+        sink.start()
+        return sink
+
+    def __enter__(self) -> "TelemetrySink":
+        """Start the sink."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush and close the sink."""
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        """Return True while the writer thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background writer thread."""
+        if self.running:
+            return
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._write_loop, name="telemetry-sink", daemon=True
+        )
+        self._thread.start()
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Flush the pending samples and stop the writer thread.
+
+        :param timeout: Seconds to wait for the thread to finish.
+        :return: None
+        """
+        if not self.running or self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def record_timing(self, name: str, seconds: float) -> None:
+        """Record the duration of an operation.
+
+        :param name: Name of the operation.
+        :param seconds: Duration in seconds.
+        :return: None
+        """
+        self._queue.put((time.perf_counter(), TIMING, name, seconds))
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Add to a counter.
+
+        :param name: Name of the counter.
+        :param value: Amount to add.
+        :return: None
+        """
+        self._queue.put((time.perf_counter(), COUNTER, name, value))
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the duration of the enclosed block.
+
+        :param name: Name of the operation.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_timing(name, time.perf_counter() - start)
+
+    def _write_loop(self) -> None:
+        stopped = False
+        while not stopped:
+            lines, stopped = self._drain(
+                deadline=time.monotonic() + self.flush_interval
+            )
+            now = time.perf_counter() - self._start_time
+            lines.extend(
+                json.dumps({"time": now, "kind": COUNTER, "name": name, "value": total})
+                for name, total in self._counters.items()
+            )
+            if lines:
+                with self.filepath.open("a", encoding=ENCODING) as file:
+                    file.write("\n".join(lines) + "\n")
+
+    def _drain(self, deadline: float) -> tuple[list[str], bool]:
+        """Collect samples until the deadline or the stop marker."""
+        lines: list[str] = []
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0.0:
+                return lines, False
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return lines, False
+            if item is _STOP:
+                return lines, True
+            timestamp, kind, name, value = item
+            if kind == COUNTER:
+                self._counters[name] += value
+                continue
+            sample = {
+                "time": timestamp - self._start_time,
+                "kind": kind,
+                "name": name,
+                "value": value,
+            }
+            lines.append(json.dumps(sample))
@@ -1,8 +1,10 @@
 """Configure the logger."""
 
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Any, ClassVar
 
 from loguru import logger
 
@@ -11,7 +13,9 @@ from exo_oscilloscope.config.definitions import (
     DEFAULT_LOG_FILENAME,
     DEFAULT_LOG_LEVEL,
     ENCODING,
+    HOT_PATH_LOG_INTERVAL,
     LOG_DIR,
+    LogLevel,
 )
 
 
@@ -53,7 +57,60 @@ def setup_logger(
     filepath_with_time = create_timestamped_filepath(
         output_dir=log_filepath, prefix=filename, suffix="log"
     )
+    RateLimitedLogger.min_level_no = min(
+        logger.level(stderr_level).no, logger.level(log_level).no
+    )
     logger.add(sys.stderr, level=stderr_level)
     logger.add(filepath_with_time, level=log_level, encoding=ENCODING, enqueue=True)
     logger.info(f"Logging to '{filepath_with_time}'.")
     return filepath_with_time
+
+
+class RateLimitedLogger:
+    """Level-guarded, rate-limited logger for per-sample and per-frame code.
+
+    The level check is a single integer comparison against the lowest level
+    configured by :func:`setup_logger`, so a disabled call returns before the
+    message is formatted. Pass format arguments instead of f-strings to keep
+    it that way. Enabled messages are emitted at most once per interval.
+    """
+
+    # Lowest level accepted by any sink, loguru's default stderr sink is DEBUG
+    min_level_no: ClassVar[int] = logger.level(LogLevel.debug).no
+
+    def __init__(
+        self, level: str = LogLevel.trace, interval: float = HOT_PATH_LOG_INTERVAL
+    ) -> None:
+        """Initialize the logger.
+
+        :param level: Level of the emitted messages.
+        :param interval: Minimum number of seconds between two messages.
+        """
+        self.level = level
+        self.level_no = logger.level(level).no
+        self.interval = interval
+        self.suppressed = 0
+        self._next_time = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if messages at this level reach any sink."""
+        return self.level_no >= RateLimitedLogger.min_level_no
+
+    def log(self, message: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message if the level is enabled and the interval has passed.
+
+        :param message: Message, formatted lazily with args and kwargs.
+        :return: None
+        """
+        if self.level_no < RateLimitedLogger.min_level_no:
+            return
+        now = time.monotonic()
+        if now < self._next_time:
+            self.suppressed += 1
+            return
+        self._next_time = now + self.interval
+        if self.suppressed:
+            message = f"{message} ({self.suppressed} similar messages suppressed)"
+            self.suppressed = 0
+        logger.opt(depth=1).log(self.level, message, *args, **kwargs)
@@ -0,0 +1,266 @@
+"""Test the safety-limit alarm engine."""
+
+import asyncio
+import json
+import os
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from exo_oscilloscope.alarms import (
+    _STOP,
+    AlarmEngine,
+    DurationRule,
+    EventLog,
+    RateRule,
+    ThresholdRule,
+    load_rules,
+)
+from exo_oscilloscope.data_classes import AlarmEvent, MotorData, SampleBatch
+from exo_oscilloscope.plotter import ExoPlotter
+from exo_oscilloscope.sim_update import simulate_imu
+from exo_oscilloscope.sources import AsyncSource, run_source
+
+# Run Qt in headless mode (required for CI)
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+def make_motors(torques: list[float], dt: float = 0.1) -> list[MotorData]:
+    """Make motor samples with the given torques."""
+    return [
+        MotorData(timestamp=i * dt, torque=torque, speed=0.0, position=0.0)
+        for i, torque in enumerate(torques)
+    ]
+
+
+def test_threshold_rule_fires_once_per_excursion() -> None:
+    """Test that a threshold rule reports the first sample of each excursion."""
+    # Arrange
+    engine = AlarmEngine([ThresholdRule("torque_max", "torque", upper=1.0)])
+    motors = make_motors([0.0, 2.0, 3.0, 0.0, 2.0])
+
+    # Act
+    events = engine.evaluate_motors(device=0, motors=motors)
+
+    # Assert
+    assert [e.timestamp for e in events] == pytest.approx([0.1, 0.4])
+    assert [e.value for e in events] == [2.0, 2.0]
+    assert len(engine.event_log) == 2
+
+
+def test_threshold_rule_across_batches() -> None:
+    """Test that an excursion spanning two batches is reported once."""
+    # Arrange
+    engine = AlarmEngine([ThresholdRule("torque_max", "torque", upper=1.0)])
+    motors = make_motors([0.0, 2.0, 2.0, 2.0])
+
+    # Act
+    first = engine.evaluate_motors(device=0, motors=motors[:2])
+    second = engine.evaluate_motors(device=0, motors=motors[2:])
+
+    # Assert
+    assert len(first) == 1
+    assert second == []
+
+
+def test_rate_rule() -> None:
+    """Test that a rate rule uses the last sample of the previous batch."""
+    # Arrange
+    engine = AlarmEngine([RateRule("torque_rate", "torque", max_rate=5.0)])
+    motors = make_motors([0.0, 0.1, 0.2, 1.0])
+
+    # Act
+    first = engine.evaluate_motors(device=0, motors=motors[:3])
+    second = engine.evaluate_motors(device=0, motors=motors[3:])
+
+    # Assert
+    assert first == []
+    assert [e.timestamp for e in second] == pytest.approx([0.3])
+
+
+def test_duration_rule() -> None:
+    """Test that a duration rule waits for the minimum duration."""
+    # Arrange
+    rule = DurationRule("torque_hold", "torque", min_duration=0.25, upper=1.0)
+    engine = AlarmEngine([rule])
+    motors = make_motors([2.0, 2.0, 0.0, 2.0, 2.0, 2.0, 2.0])
+
+    # Act
+    events = engine.evaluate_motors(device=0, motors=motors[:5])
+    events += engine.evaluate_motors(device=0, motors=motors[5:])
+
+    # Assert
+    assert [e.timestamp for e in events] == pytest.approx([0.6])
+
+
+def test_imu_rule_and_devices() -> None:
+    """Test that IMU rules are evaluated separately per device."""
+    # Arrange
+    engine = AlarmEngine([ThresholdRule("gyro_max", "gyro_x", upper=100.0)])
+    imus = [simulate_imu(0.0)]  # gyro_x = 180 deg/s
+
+    # Act
+    events = engine.evaluate(device=0, imus=imus, motors=[])
+    events += engine.evaluate(device=1, imus=imus, motors=[])
+
+    # Assert
+    assert [(e.device, e.signal) for e in events] == [(0, "gyro_x"), (1, "gyro_x")]
+
+
+def test_load_rules() -> None:
+    """Test loading rules of every type from a JSON file."""
+    with TemporaryDirectory() as output_dir:
+        # Arrange
+        filepath = Path(output_dir) / "rules.json"
+        filepath.write_text(
+            json.dumps(
+                [
+                    {"type": "threshold", "name": "t", "signal": "torque", "upper": 1},
+                    {"type": "rate", "name": "r", "signal": "gyro_x", "max_rate": 5},
+                    {
+                        "type": "duration",
+                        "name": "d",
+                        "signal": "speed",
+                        "min_duration": 0.5,
+                        "upper": 1,
+                    },
+                ]
+            )
+        )
+
+        # Act
+        rules = load_rules(filepath)
+
+    # Assert
+    assert rules == [
+        ThresholdRule("t", "torque", upper=1),
+        RateRule("r", "gyro_x", max_rate=5),
+        DurationRule("d", "speed", min_duration=0.5, upper=1),
+    ]
+
+
+def test_unknown_signal() -> None:
+    """Test that rules on unknown signals are rejected."""
+    with pytest.raises(ValueError):
+        AlarmEngine([ThresholdRule("bad", "voltage", upper=1.0)])
+
+
+def test_event_log() -> None:
+    """Test that the event log is sorted by timestamp and written to CSV."""
+    with TemporaryDirectory() as output_dir:
+        # Arrange
+        event_log = EventLog.create(output_dir=Path(output_dir))
+        engine = AlarmEngine(
+            [ThresholdRule("torque_max", "torque", upper=1.0)], event_log=event_log
+        )
+
+        # Act
+        engine.evaluate_motors(device=1, motors=make_motors([0.0, 0.0, 2.0]))
+        engine.evaluate_motors(device=0, motors=make_motors([2.0]))
+        event_log.close()
+
+        # Assert
+        assert [e.timestamp for e in event_log.events] == pytest.approx([0.0, 0.2])
+        assert [e.device for e in event_log.between(0.1, 1.0)] == [1]
+        assert event_log.filepath is not None
+        lines = event_log.filepath.read_text().splitlines()
+        assert lines[0] == "timestamp,device,rule,signal,value"
+        assert len(lines) == 3
+
+
+def test_event_log_shared_path() -> None:
+    """Test that a second log on the same path appends instead of truncating."""
+    with TemporaryDirectory() as output_dir:
+        # Arrange
+        filepath = Path(output_dir) / "events.csv"
+        event = AlarmEvent(timestamp=0.0, device=0, rule="r", signal="torque", value=2)
+
+        # Act
+        first = EventLog(filepath=filepath)
+        first.add([event])
+        first.close()
+        second = EventLog(filepath=filepath)
+        second.add([event])
+        second.close()
+
+        # Assert
+        lines = filepath.read_text().splitlines()
+        assert lines[0] == "timestamp,device,rule,signal,value"
+        assert len(lines) == 3
+
+
+def test_event_log_add_after_close() -> None:
+    """Test that events added after close stay in memory only."""
+    with TemporaryDirectory() as output_dir:
+        # Arrange
+        filepath = Path(output_dir) / "events.csv"
+        event = AlarmEvent(timestamp=0.0, device=0, rule="r", signal="torque", value=2)
+        event_log = EventLog(filepath=filepath)
+        event_log.add([event])
+
+        # Act
+        event_log.close()
+        event_log.add([event])
+        event_log.close()
+
+        # Assert
+        assert len(event_log) == 2
+        assert len(filepath.read_text().splitlines()) == 2
+
+
+def test_event_log_stop_before_pending_events() -> None:
+    """Test that the writer survives events queued behind the stop marker."""
+    with TemporaryDirectory() as output_dir:
+        # Arrange
+        filepath = Path(output_dir) / "events.csv"
+        event = AlarmEvent(timestamp=0.0, device=0, rule="r", signal="torque", value=2)
+        event_log = EventLog(filepath=filepath)
+        event_log._queue.put([event])
+        event_log._queue.put(_STOP)
+        event_log._queue.put([event])
+
+        # Act
+        assert event_log._writer is not None
+        event_log._writer.join(1.0)
+
+        # Assert
+        assert not event_log._writer.is_alive()
+        assert len(filepath.read_text().splitlines()) == 2
+
+
+def test_run_source_attaches_events() -> None:
+    """Test that alarms are evaluated on the ingest path before emitting."""
+
+    class MotorSource(AsyncSource):
+        async def stream(self) -> AsyncGenerator[SampleBatch, None]:
+            yield SampleBatch(device=self.device, motors=make_motors([0.0, 2.0]))
+
+    # Arrange
+    engine = AlarmEngine([ThresholdRule("torque_max", "torque", upper=1.0)])
+    batches: list[SampleBatch] = []
+
+    # Act
+    asyncio.run(run_source(MotorSource("motor", device=1), batches.append, engine))
+
+    # Assert
+    assert [(e.device, e.timestamp) for e in batches[0].events] == [(1, 0.1)]
+    assert len(engine.event_log) == 1
+
+
+def test_plotter_markers() -> None:
+    """Test that alarms attached to a batch are marked on the plots."""
+    # Arrange
+    engine = AlarmEngine([ThresholdRule("torque_max", "torque", upper=1.0)])
+    gui = ExoPlotter(alarm_engine=engine)
+    batch = SampleBatch(device=1, motors=make_motors([0.0, 2.0]))
+    batch.events = engine.evaluate_batch(batch)
+
+    # Act
+    gui.update_batch(batch)
+
+    # Assert
+    assert gui.right_motor.markers.times.tolist() == pytest.approx([0.1])
+    assert gui.left_motor.markers.times.size == 0
+    gui.close()
@@ -0,0 +1,100 @@
+"""Test the benchmark suite."""
+
+import copy
+import itertools
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from exo_oscilloscope.benchmark import (
+    OPERATIONS,
+    BenchmarkCase,
+    BenchmarkReport,
+    _batch_pool,
+    make_cases,
+    run_benchmarks,
+)
+from exo_oscilloscope.config.definitions import BENCHMARK_POOL_SIZE
+
+# Run Qt in headless mode (required for CI)
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+def test_make_cases() -> None:
+    """Test that every case has an operation and a unique key."""
+    # Act
+    cases = make_cases(buffer_sizes=[10, 20], device_counts=[1, 2], batch_sizes=[5])
+
+    # Assert
+    assert {case.name for case in cases} == set(OPERATIONS)
+    assert len({case.key for case in cases}) == len(cases)
+
+
+def test_run_save_and_compare() -> None:
+    """Test a small benchmark run, its JSON round trip and the comparison."""
+    # Arrange
+    cases = make_cases(buffer_sizes=[10], device_counts=[1], batch_sizes=[5])
+
+    # Act
+    report = run_benchmarks(cases, repeats=2)
+    with TemporaryDirectory() as output_dir:
+        filepath = Path(output_dir) / "baseline.json"
+        report.save(filepath)
+        baseline = BenchmarkReport.load(filepath)
+
+    # Assert
+    assert baseline.results == report.results
+    assert all(r.time_per_call_us > 0.0 for r in report.results)
+    assert report.compare(baseline) == []
+
+
+@pytest.mark.parametrize("slowdown, expected", [(1.1, 0), (2.0, 1)])
+def test_compare_threshold(slowdown: float, expected: int) -> None:
+    """Test that only slowdowns beyond the threshold are flagged."""
+    # Arrange
+    cases = make_cases(buffer_sizes=[10], device_counts=[1], batch_sizes=[])[:1]
+    baseline = run_benchmarks(cases, repeats=2)
+    current = copy.deepcopy(baseline)
+    current.results[0].time_per_call_us *= slowdown
+
+    # Act
+    regressions = current.compare(baseline, threshold=0.2)
+
+    # Assert
+    assert len(regressions) == expected
+
+
+def test_unmatched_keys() -> None:
+    """Test that cases missing from either report are reported."""
+    # Arrange
+    cases = make_cases(buffer_sizes=[10], device_counts=[1], batch_sizes=[])[:2]
+    baseline = run_benchmarks(cases, repeats=2)
+    current = copy.deepcopy(baseline)
+    current.results[1].case.name = "renamed"
+
+    # Act
+    unmatched = current.unmatched_keys(baseline)
+
+    # Assert
+    assert unmatched == sorted(
+        [baseline.results[1].case.key, current.results[1].case.key]
+    )
+
+
+def test_batch_pool_time_increases() -> None:
+    """Test that cycling the batch pool never moves time backwards."""
+    # Arrange
+    case = BenchmarkCase("plotter.update_batch", 10, 1, 5)
+    pool = _batch_pool(case)
+
+    # Act
+    times = [
+        imu.timestamp
+        for _ in range(2 * BENCHMARK_POOL_SIZE)
+        for imu in next(pool)[0].imus
+    ]
+
+    # Assert
+    assert all(t1 > t0 for t0, t1 in itertools.pairwise(times))
@@ -0,0 +1,116 @@
+"""Test the async sources."""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncGenerator
+
+from PySide6.QtCore import QTimer
+
+from exo_oscilloscope.data_classes import MotorData, SampleBatch
+from exo_oscilloscope.plotter import ExoPlotter
+from exo_oscilloscope.sim_update import SimulatedSource
+from exo_oscilloscope.sources import AsyncSource, run_source
+
+# Run Qt in headless mode (required for CI)
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+class FlakySource(AsyncSource):
+    """Source that fails on its first connection and then yields two batches."""
+
+    def __init__(self) -> None:
+        super().__init__(name="flaky", device=0, timeout=0.05, reconnect_delay=0.0)
+        self.connections = 0
+
+    async def stream(self) -> AsyncGenerator[SampleBatch, None]:
+        """Raise on the first connection, hang on the second, then succeed."""
+        self.connections += 1
+        if self.connections == 1:
+            raise ConnectionError("device unplugged")
+        if self.connections == 2:
+            await asyncio.sleep(1.0)
+        for t in (0.0, 1.0):
+            motor = MotorData(timestamp=t, torque=t, speed=t, position=t)
+            yield SampleBatch(device=self.device, motors=[motor])
+
+
+def test_run_source_reconnects() -> None:
+    """Test that a source is restarted after an error and a timeout."""
+    # Arrange
+    source = FlakySource()
+    batches: list[SampleBatch] = []
+
+    # Act
+    asyncio.run(run_source(source, batches.append))
+
+    # Assert
+    assert source.connections == 3
+    assert [b.motors[0].timestamp for b in batches] == [0.0, 1.0]
+
+
+def test_run_source_max_retries() -> None:
+    """Test that a source gives up after the maximum number of retries."""
+    # Arrange
+    source = FlakySource()
+    source.max_retries = 0
+    batches: list[SampleBatch] = []
+
+    # Act
+    asyncio.run(run_source(source, batches.append))
+
+    # Assert
+    assert source.connections == 1
+    assert batches == []
+
+
+class BadPacketSource(AsyncSource):
+    """Source whose first connection yields a malformed packet."""
+
+    def __init__(self) -> None:
+        super().__init__(name="bad-packet", device=0, reconnect_delay=0.0)
+        self.connections = 0
+
+    async def stream(self) -> AsyncGenerator[SampleBatch, None]:
+        """Raise a decoding error on the first connection, then yield one batch."""
+        self.connections += 1
+        if self.connections == 1:
+            raise ValueError("malformed packet")
+        yield SampleBatch(device=self.device)
+
+
+def test_run_source_reconnects_after_any_error() -> None:
+    """Test that a source is restarted after a non-I/O error."""
+    # Arrange
+    source = BadPacketSource()
+    batches: list[SampleBatch] = []
+
+    # Act
+    asyncio.run(run_source(source, batches.append))
+
+    # Assert
+    assert source.connections == 2
+    assert len(batches) == 1
+
+
+def test_plotter_with_sources() -> None:
+    """Test that simulated async sources reach the plots."""
+    # Arrange
+    close_millisec = 200
+    gui = ExoPlotter()
+    start_time = time.time()
+    sources = [
+        SimulatedSource(device=i, start_time=start_time, rate_hz=1000.0)
+        for i in range(len(gui.devices))
+    ]
+
+    # Act
+    try:
+        QTimer.singleShot(close_millisec, gui.close)
+        gui.run(sources=sources)
+    finally:
+        gui.close()
+
+    # Assert
+    assert gui.left_imu.time_buf[-1] > 0.0
+    assert gui.right_motor.time_buf[-1] > 0.0
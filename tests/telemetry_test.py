@@ -0,0 +1,79 @@
+"""Test the telemetry sink."""
+
+import json
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from exo_oscilloscope.data_classes import AlarmEvent, SampleBatch
+from exo_oscilloscope.plotter import ExoPlotter
+from exo_oscilloscope.sim_update import simulate_imu, simulate_motor
+from exo_oscilloscope.telemetry import COUNTER, TIMING, TelemetrySink
+
+# Run Qt in headless mode (required for CI)
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+
+def test_telemetry_sink() -> None:
+    """Test that timings and counter totals are written as JSON lines."""
+    with TemporaryDirectory() as output_dir:
+        # Arrange
+        sink = TelemetrySink.create(output_dir=Path(output_dir))
+
+        # Act
+        with sink.timer("update"):
+            pass
+        sink.record_timing("update", 0.5)
+        sink.increment("samples", 10)
+        sink.increment("samples", 5)
+        sink.close()
+
+        # Assert
+        assert not sink.running
+        records = [json.loads(line) for line in sink.filepath.read_text().splitlines()]
+        timings = [r["value"] for r in records if r["kind"] == TIMING]
+        counters = [r for r in records if r["kind"] == COUNTER]
+        assert len(timings) == 2
+        assert timings[1] == 0.5
+        assert counters[-1]["name"] == "samples"
+        assert counters[-1]["value"] == 15
+
+
+def test_telemetry_context_manager() -> None:
+    """Test that the context manager starts and stops the writer thread."""
+    with TemporaryDirectory() as output_dir:
+        # Arrange
+        filepath = Path(output_dir) / "telemetry.jsonl"
+
+        # Act
+        with TelemetrySink(filepath=filepath, flush_interval=0.01) as sink:
+            assert sink.running
+            sink.increment("frames")
+
+        # Assert
+        assert not sink.running
+        assert filepath.exists()
+
+
+def test_plotter_telemetry() -> None:
+    """Test that the plotter records update timings, sample and alarm counts."""
+    with TemporaryDirectory() as output_dir:
+        # Arrange
+        sink = TelemetrySink.create(output_dir=Path(output_dir))
+        gui = ExoPlotter(telemetry=sink)
+        imu, motor = simulate_imu(0.0), simulate_motor(0.0)
+        event = AlarmEvent(timestamp=0.0, device=0, rule="r", signal="torque", value=2)
+
+        # Act
+        gui.update_plots(imus=[imu, imu], motors=[motor, motor], events=[event])
+        gui.update_batch(SampleBatch(device=0, imus=[imu], motors=[motor]))
+        gui.close()
+        sink.close()
+
+        # Assert
+        records = [json.loads(line) for line in sink.filepath.read_text().splitlines()]
+        names = {r["name"] for r in records}
+        assert {"plotter.update_plots", "plotter.update_batch"} <= names
+        assert {"plotter.samples", "plotter.samples.device0"} <= names
+        alarms = [r["value"] for r in records if r["name"] == "alarms"]
+        assert alarms[-1] == 1
@@ -1,10 +1,14 @@
 """Test the utils module."""
 
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+from loguru import logger
+
 from exo_oscilloscope.config.definitions import LogLevel
-from exo_oscilloscope.utils import setup_logger
+from exo_oscilloscope.utils import RateLimitedLogger, setup_logger
 
 
 def test_logger_init() -> None:
@@ -23,3 +27,31 @@ def test_log_level() -> None:
 
     # Assert
     assert type(log_levels) is list
+
+
+def test_rate_limited_logger(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that hot-path messages are level guarded and rate limited."""
+    # Arrange
+    monkeypatch.setattr(
+        RateLimitedLogger, "min_level_no", RateLimitedLogger.min_level_no
+    )  # restored after the test, setup_logger changes it
+    interval = 0.05
+    messages: list[str] = []
+    with TemporaryDirectory() as log_dir:
+        setup_logger(log_dir=Path(log_dir), log_level=LogLevel.debug)
+        logger.add(messages.append, level=LogLevel.debug, format="{message}")
+        trace_log = RateLimitedLogger(level=LogLevel.trace)
+        debug_log = RateLimitedLogger(level=LogLevel.debug, interval=interval)
+
+        # Act
+        for i in range(3):
+            trace_log.log("trace {}", i)
+            debug_log.log("debug {}", i)
+        time.sleep(2 * interval)
+        debug_log.log("debug {}", 3)
+        logger.remove()
+
+    # Assert
+    assert not trace_log.enabled
+    assert debug_log.enabled
+    assert messages == ["debug 0\n", "debug 3 (2 similar messages suppressed)\n"]